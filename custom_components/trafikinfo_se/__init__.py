@@ -246,6 +246,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: TrafikinfoConfigEntry) -
         await hass.config_entries.async_reload(updated_entry.entry_id)
 
     entry.async_on_unload(entry.add_update_listener(_options_updated))
+    # Stop scheduled refreshes and release coordinator-owned resources
+    # (e.g. the dedicated icon download session) when the entry unloads.
+    entry.async_on_unload(refresh_target.async_shutdown)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -66,13 +67,18 @@ DEFAULT_RADIUS_KM = 25.0
 DEFAULT_FILTER_MODE = FILTER_MODE_COORDINATE
 DEFAULT_COUNTIES: list[str] = [COUNTY_ALL]
 
+# Interned so category dict lookups and set membership across the
+# integration compare by identity and reuse the cached hash.
 DEFAULT_MESSAGE_TYPES: list[str] = [
-    "Viktig trafikinformation",
-    "Hinder",
-    "Olycka",
-    "Restriktion",
-    "Trafikmeddelande",
-    "Vägarbete",
+    sys.intern(s)
+    for s in (
+        "Viktig trafikinformation",
+        "Hinder",
+        "Olycka",
+        "Restriktion",
+        "Trafikmeddelande",
+        "Vägarbete",
+    )
 ]
 
 SITUATION_SCHEMA_VERSION = "1.6"
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
+import io
+import json
 import logging
 import math
+from xml.parsers import expat
+from operator import itemgetter
+import os
 from pathlib import Path
 import re
+import sys
+from time import monotonic
 from typing import Any
 from urllib.parse import quote
 import xml.etree.ElementTree as ET
@@ -16,6 +24,12 @@ import xml.etree.ElementTree as ET
 import aiohttp
 import async_timeout
 
+try:
+    # Optional: C-level parser, noticeably faster on large responses.
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import aiohttp_client
@@ -38,6 +52,7 @@ from .const import (
     DEFAULT_RADIUS_KM,
     DEFAULT_FILTER_MODE,
     DEFAULT_MAX_ITEMS,
+    DEFAULT_MESSAGE_TYPES,
     DEFAULT_ROAD_FILTER_SAFETY_BYPASS,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SORT_MODE,
@@ -57,7 +72,59 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-_WKT_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+# Maps WKT structural characters to spaces so str.split() tokenizes in C.
+_WKT_DELIM_TRANS = str.maketrans(",()", "   ")
+
+# Responses larger than this are parsed in an executor thread instead of
+# blocking the event loop (see _async_update_data).
+_PARSE_EXECUTOR_THRESHOLD = 1_048_576  # 1 MiB
+
+# One shared timeout object for all icon downloads (aiohttp applies it per
+# request; building it once avoids a per-fetch allocation).
+_ICON_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# How long a definitively-missing icon (404 / non-image payload) is remembered
+# before we ask the server about it again.
+_ICON_MISSING_TTL = 6 * 3600  # seconds
+
+# Cheap pre-parse probe for an unchanged dataset (see _async_update_data).
+_LASTCHANGEID_RE = re.compile(rb"<(?:\w+:)?LASTCHANGEID>([^<]+)</")
+
+# Packed sort key layout for nearest/relevance (see sort_events):
+# bit 53 = not-important, bit 52 = distance missing,
+# bits 32-51 = distance in meters (capped), bits 0-31 = inverted pub epoch.
+_DIST_KEY_MASK = (1 << 20) - 1
+_MISSING_DIST_SHIFT = 52
+_IMPORTANT_SHIFT = 53
+
+# Road filter token normalization (compiled once; the per-event hot path
+# only does set/substring checks against pre-normalized tokens).
+_ROAD_PREFIX_RE = re.compile(r"^(?:väg|vag|road)\s+", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+
+_PARSE_ERRORS: tuple[type[Exception], ...] = (ET.ParseError,)
+if LET is not None:
+    _PARSE_ERRORS = (ET.ParseError, LET.XMLSyntaxError)
+
+
+_ITERPARSE_EVENTS = ("start", "end")
+
+
+def _iterparse(data: bytes):
+    """Return a (start, end) iterparse iterator, preferring lxml's C parser."""
+    if LET is not None:
+        # collect_ids=False skips the per-parse XML-ID hash that we never
+        # query; resolve_entities=False avoids entity expansion work (the
+        # Datacache feed doesn't use entities).
+        return LET.iterparse(
+            io.BytesIO(data),
+            events=_ITERPARSE_EVENTS,
+            huge_tree=False,
+            recover=False,
+            collect_ids=False,
+            resolve_entities=False,
+        )
+    return ET.iterparse(io.BytesIO(data), events=_ITERPARSE_EVENTS)
 
 
 class TrafikinfoError(Exception):
@@ -94,17 +161,16 @@ def _try_unlink(path: Path) -> None:
         pass
 
 
-def _looks_like_png(data: bytes) -> bool:
-    return isinstance(data, (bytes, bytearray)) and data.startswith(
-        b"\x89PNG\r\n\x1a\n"
-    )
-
-
-def _looks_like_svg(data: bytes) -> bool:
+def _sniff_image(data: bytes) -> str | None:
+    """Classify an image payload as "png", "svg" or None in one pass."""
     if not isinstance(data, (bytes, bytearray)):
-        return False
+        return None
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
     head = data[:300].lstrip()
-    return head.startswith(b"<") and b"<svg" in head.lower()
+    if head.startswith(b"<") and b"<svg" in head.lower():
+        return "svg"
+    return None
 
 
 @dataclass(frozen=True, slots=True)
@@ -140,21 +206,26 @@ class TrafikinfoEvent:
     version_time: datetime | None
     publication_time: datetime | None
     modified_time: datetime | None
+    # Remote icon URL, precomputed at parse time so as_dict (called on every
+    # attribute render) doesn't re-quote the icon id each time.
+    icon_url: str | None = None
+    # Stable message category, resolved once at parse time; the dataclass is
+    # frozen with slots, so per-instance memoization has to be a real field.
+    category: str | None = None
 
     def as_dict(self) -> dict[str, Any]:
         def _dt(v: datetime | None) -> str | None:
             return v.isoformat() if isinstance(v, datetime) else None
 
-        icon_id = self.icon_id
-        icon_url: str | None = None
-        if icon_id:
+        icon_url = self.icon_url
+        if icon_url is None and self.icon_id:
             # Prefer the v2 icon dataset URL (matches what the Icon API returns in `Url`)
-            icon_url = f"{TRAFIKVERKET_ICON_V2_URL_PREFIX}{quote(icon_id, safe='')}"
+            icon_url = f"{TRAFIKVERKET_ICON_V2_URL_PREFIX}{quote(self.icon_id, safe='')}"
 
         return {
             "situation_id": self.situation_id,
             "deviation_id": self.deviation_id,
-            "icon_id": icon_id,
+            "icon_id": self.icon_id,
             "icon_url": icon_url,
             "message_type": self.message_type,
             "message_type_value": self.message_type_value,
@@ -195,6 +266,78 @@ class TrafikinfoData:
     sse_url: str | None
 
 
+# Map known MessageTypeValue (code values) into our stable categories.
+# Note: MessageType is typically Swedish category text (e.g. "Olycka"),
+# while MessageTypeValue is a more fine-grained English code (e.g. "Accident").
+# Values interned so they share identity with the DEFAULT_MESSAGE_TYPES
+# constants used as grouping keys.
+MESSAGE_TYPE_VALUE_TO_CATEGORY: dict[str, str] = {
+    # Olycka
+    "Accident": "Olycka",
+    # Hinder
+    "GeneralObstruction": "Hinder",
+    # Vägarbete
+    "MaintenanceWorks": "Vägarbete",
+    # Trafikmeddelande (many subtypes)
+    "VehicleObstruction": "Trafikmeddelande",
+    "AnimalPresenceObstruction": "Trafikmeddelande",
+    "RoadsideAssistance": "Trafikmeddelande",
+    "SpeedManagement": "Trafikmeddelande",
+    "ReroutingManagement": "Trafikmeddelande",
+    "EnvironmentalObstruction": "Trafikmeddelande",
+    "RoadOrCarriagewayOrLaneManagement": "Trafikmeddelande",
+}
+MESSAGE_TYPE_VALUE_TO_CATEGORY = {
+    k: sys.intern(v) for k, v in MESSAGE_TYPE_VALUE_TO_CATEGORY.items()
+}
+
+
+# Known stable categories mapped to their interned canonical object, built
+# once at import; the resolver returns the canonical string so grouping keys
+# share identity (and cached hashes) across events and sensors.
+_KNOWN_CATEGORIES: dict[str, str] = {c: c for c in DEFAULT_MESSAGE_TYPES}
+
+# One dispatch table for both Swedish labels (identity) and English code
+# values (mapped), so categorization is two dict gets instead of a chain of
+# membership tests. The key spaces don't overlap.
+_CATEGORY_DISPATCH: dict[str, str] = {
+    **_KNOWN_CATEGORIES,
+    **MESSAGE_TYPE_VALUE_TO_CATEGORY,
+}
+
+
+def _categorize(msg_type: str | None, msg_value: str | None) -> str | None:
+    """Resolve the stable category from MessageType / MessageTypeValue."""
+    # Known Swedish labels and English code values share one dispatch table;
+    # both gets are None-safe and the common case returns the interned
+    # canonical string on the first lookup.
+    cat = _CATEGORY_DISPATCH.get(msg_type) or _CATEGORY_DISPATCH.get(msg_value)
+    if cat is not None:
+        return cat
+
+    # If we still don't know: fall back to MessageType if it's set (even if
+    # unexpected), otherwise keep it unclassified.
+    if msg_type:
+        stripped = msg_type.strip()
+        if stripped:
+            return stripped
+
+    return None
+
+
+def _category_for_event(event: Any) -> str | None:
+    """Resolve one of the stable categories for a TrafikinfoEvent-like object."""
+    # Events built by this parser carry the category precomputed at parse
+    # time; only foreign event-like objects fall through to the resolver.
+    cached = getattr(event, "category", None)
+    if cached is not None:
+        return cached
+    return _categorize(
+        getattr(event, "message_type", None),
+        getattr(event, "message_type_value", None),
+    )
+
+
 def _strip(s: str | None) -> str | None:
     if not isinstance(s, str):
         return None
@@ -206,11 +349,7 @@ def _as_bool(v: str | None) -> bool | None:
     v = _strip(v)
     if v is None:
         return None
-    if v.lower() in ("true", "1", "yes"):
-        return True
-    if v.lower() in ("false", "0", "no"):
-        return False
-    return None
+    return _BOOL_MAP.get(v.lower())
 
 
 def _as_int(v: str | None) -> int | None:
@@ -223,6 +362,65 @@ def _as_int(v: str | None) -> int | None:
         return None
 
 
+# Pre-bound math functions: these run per geometry point in the distance hot
+# path, where the module attribute lookups are a measurable cost.
+_sin = math.sin
+_cos = math.cos
+_asin = math.asin
+_sqrt = math.sqrt
+_rad = math.radians
+_EARTH_RADIUS_KM = 6371.0
+_DEG2RAD = math.pi / 180.0
+
+
+def _equirect_km(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Flat-earth (equirectangular) distance approximation in km."""
+    x = (lon2 - lon1) * _cos(_rad((lat1 + lat2) / 2))
+    y = lat2 - lat1
+    return _sqrt(x * x + y * y) * 111.32
+
+
+def _haversine_km(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    p1 = _rad(lat1)
+    p2 = _rad(lat2)
+    dlat = _rad(lat2 - lat1)
+    dlon = _rad(lon2 - lon1)
+    a = _sin(dlat * 0.5) ** 2 + _cos(p1) * _cos(p2) * _sin(dlon * 0.5) ** 2
+    return 2 * _EARTH_RADIUS_KM * _asin(_sqrt(a))
+
+
+def _any_point_within_km(
+    center_lon: float,
+    center_lat: float,
+    pts: list[tuple[float, float]],
+    radius_km: float,
+    # Bound as defaults so the loop body hits locals (LOAD_FAST) rather
+    # than module globals on every trig call.
+    _sin: Any = _sin,
+    _cos: Any = _cos,
+) -> bool:
+    """Whether any (lon, lat) point lies within radius_km of the center.
+
+    Batched form of the haversine test: the center terms are hoisted out of
+    the loop and the radius is converted to a haversine threshold once, so
+    each point costs two sins and a cos instead of a full distance (no
+    asin/sqrt per point).
+    """
+    p1 = center_lat * _DEG2RAD
+    cos_p1 = _cos(p1)
+    threshold = _sin(radius_km / (2 * _EARTH_RADIUS_KM)) ** 2
+    deg2rad = _DEG2RAD
+    for lon, lat in pts:
+        p2 = lat * deg2rad
+        a = (
+            _sin((p2 - p1) * 0.5) ** 2
+            + cos_p1 * _cos(p2) * _sin((lon - center_lon) * deg2rad * 0.5) ** 2
+        )
+        if a <= threshold:
+            return True
+    return False
+
+
 def _as_dt(v: str | None) -> datetime | None:
     v = _strip(v)
     if v is None:
@@ -230,26 +428,6 @@ def _as_dt(v: str | None) -> datetime | None:
     return dt_util.parse_datetime(v)
 
 
-def _findtext(elem: ET.Element, path: str) -> str | None:
-    # Namespace-agnostic element text lookup using local-name wildcards.
-    # Example path: "./Id" or "./Deviation/MessageType"
-    parts = [p for p in path.split("/") if p and p != "."]
-    cur: ET.Element | None = elem
-    for part in parts:
-        if cur is None:
-            return None
-        if part == ".":
-            continue
-        cur = cur.find(f"./{{*}}{part}")
-    if cur is None or cur.text is None:
-        return None
-    return cur.text
-
-
-def _findall(elem: ET.Element, child_tag: str) -> list[ET.Element]:
-    return list(elem.findall(f"./{{*}}{child_tag}"))
-
-
 def _build_request_xml(api_key: str, *, limit: int) -> str:
     # Request schema: https://data.trafikverket.se/documentation/datacache/the-request
     # Data model: https://data.trafikverket.se/documentation/datacache/data-model?namespace=Road.TrafficInfo&collection=Situation
@@ -276,113 +454,139 @@ def _build_request_xml(api_key: str, *, limit: int) -> str:
     )
 
 
-def _parse_response(xml_text: str) -> TrafikinfoData:
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as err:
-        raise TrafikinfoParseError(f"Invalid XML from Trafikverket: {err}") from err
-
-    err_msg = root.findtext(".//{*}ERROR/{*}MESSAGE")
-    if err_msg:
-        if "authentication" in err_msg.lower() or "invalid key" in err_msg.lower():
-            raise TrafikinfoAuthenticationError(
-                f"Authentication failed: {err_msg.strip()}"
-            )
-        raise TrafikinfoAPIError(f"Trafikverket API error: {err_msg.strip()}")
+# Direct text fields of a Deviation: TrafikinfoEvent attribute -> local name.
+_DEVIATION_STR_FIELDS: tuple[tuple[str, str], ...] = (
+    ("deviation_id", "Id"),
+    ("icon_id", "IconId"),
+    ("message_type", "MessageType"),
+    ("message_type_value", "MessageTypeValue"),
+    ("header", "Header"),
+    ("message", "Message"),
+    ("severity_text", "SeverityText"),
+    ("road_number", "RoadNumber"),
+    ("road_name", "RoadName"),
+    ("affected_direction", "AffectedDirection"),
+    ("affected_direction_value", "AffectedDirectionValue"),
+    ("location_descriptor", "LocationDescriptor"),
+    ("positional_description", "PositionalDescription"),
+    ("traffic_restriction_type", "TrafficRestrictionType"),
+    ("temporary_limit", "TemporaryLimit"),
+    ("weblink", "WebLink"),
+)
 
-    last_modified_raw = root.find(".//{*}INFO/{*}LASTMODIFIED")
-    last_modified: datetime | None = None
-    if last_modified_raw is not None:
-        dt_raw = last_modified_raw.attrib.get("datetime")
-        last_modified = dt_util.parse_datetime(dt_raw) if dt_raw else None
+# Accepted boolean spellings in Datacache payloads.
+_BOOL_MAP: dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "no": False,
+}
+
+
+def _event_from_deviation(
+    dev: dict[str, str | None],
+    county_no: list[int],
+    geom_wgs84: str | None,
+    *,
+    situation_id: str | None,
+    suspended: bool | None,
+    start_time: datetime | None,
+    end_time: datetime | None,
+    version_time: datetime | None,
+    pub_time: datetime | None,
+    modified_time: datetime | None,
+) -> TrafikinfoEvent:
+    """Build a TrafikinfoEvent from a {local-name: text} deviation dict."""
+    # Inline the normalization instead of calling _strip/_as_int/_as_bool per
+    # field: with ~20 fields per deviation the function-call frames alone were
+    # a measurable share of the parse loop.
+    g = dev.get
+    kw: dict[str, Any] = {
+        name: (v.strip() or None) if (v := g(tag)) else None
+        for name, tag in _DEVIATION_STR_FIELDS
+    }
+    kw["severity_code"] = _as_int(g("SeverityCode"))
+    kw["number_of_lanes_restricted"] = _as_int(g("NumberOfLanesRestricted"))
+    v = g("ValidUntilFurtherNotice")
+    kw["valid_until_further_notice"] = _BOOL_MAP.get(v.strip().lower()) if v else None
+    v = g("SafetyRelatedMessage")
+    kw["safety_related_message"] = _BOOL_MAP.get(v.strip().lower()) if v else None
+    icon_id = kw["icon_id"]
+    return TrafikinfoEvent(
+        situation_id=situation_id,
+        county_no=county_no,
+        start_time=start_time,
+        end_time=end_time,
+        suspended=suspended,
+        geometry_wgs84=geom_wgs84,
+        version_time=version_time,
+        publication_time=pub_time,
+        modified_time=modified_time,
+        icon_url=(
+            f"{TRAFIKVERKET_ICON_V2_URL_PREFIX}{quote(icon_id, safe='')}"
+            if icon_id
+            else None
+        ),
+        category=_categorize(kw["message_type"], kw["message_type_value"]),
+        **kw,
+    )
 
-    last_change_id = _strip(root.findtext(".//{*}INFO/{*}LASTCHANGEID"))
-    sse_url = _strip(root.findtext(".//{*}INFO/{*}SSEURL"))
 
-    now = dt_util.utcnow()
-    events: list[TrafikinfoEvent] = []
-    situation_count = 0
-    deviation_count = 0
-
-    for situation in root.findall(".//{*}Situation"):
-        situation_count += 1
-        deleted = _as_bool(_findtext(situation, "./Deleted"))
-        if deleted is True:
+def _process_situation(
+    sit: dict[str, str | None],
+    sit_devs: list[tuple[dict[str, str | None], list[int], str | None]],
+    events: list[TrafikinfoEvent],
+    now: datetime,
+) -> int:
+    """Turn one situation's collected dicts into events; return deviations seen."""
+    if _as_bool(sit.get("Deleted")) is True:
+        return 0
+    situation_id = _strip(sit.get("Id"))
+    pub_time = _as_dt(sit.get("PublicationTime"))
+    version_time = _as_dt(sit.get("VersionTime"))
+    modified_time = _as_dt(sit.get("ModifiedTime"))
+    for d, county_no, geom in sit_devs:
+        suspended = _as_bool(d.get("Suspended"))
+        if suspended is True:
             continue
+        end_time = _as_dt(d.get("EndTime"))
+        if end_time is not None and end_time < now:
+            continue
+        events.append(
+            _event_from_deviation(
+                d,
+                county_no,
+                geom,
+                situation_id=situation_id,
+                suspended=suspended,
+                start_time=_as_dt(d.get("StartTime")),
+                end_time=end_time,
+                version_time=version_time,
+                pub_time=pub_time,
+                modified_time=modified_time,
+            )
+        )
+    return len(sit_devs)
 
-        situation_id = _strip(_findtext(situation, "./Id"))
-        pub_time = _as_dt(_findtext(situation, "./PublicationTime"))
-        version_time = _as_dt(_findtext(situation, "./VersionTime"))
-        modified_time = _as_dt(_findtext(situation, "./ModifiedTime"))
-
-        deviations = _findall(situation, "Deviation")
-        deviation_count += len(deviations)
-        for dev in deviations:
-            suspended = _as_bool(_findtext(dev, "./Suspended"))
-            if suspended is True:
-                continue
 
-            end_time = _as_dt(_findtext(dev, "./EndTime"))
-            if end_time is not None and end_time < now:
-                continue
+def _raise_for_error(err_msg: str | None) -> None:
+    if not err_msg:
+        return
+    if "authentication" in err_msg.lower() or "invalid key" in err_msg.lower():
+        raise TrafikinfoAuthenticationError(f"Authentication failed: {err_msg.strip()}")
+    raise TrafikinfoAPIError(f"Trafikverket API error: {err_msg.strip()}")
 
-            start_time = _as_dt(_findtext(dev, "./StartTime"))
-
-            county_no: list[int] = []
-            for c in dev.findall("./{*}CountyNo"):
-                val = _as_int(c.text)
-                if val is not None:
-                    county_no.append(val)
-
-            # Geometry (prefer WGS84 if present)
-            geom_wgs84 = _strip(dev.findtext(".//{*}Geometry//{*}WGS84"))
-
-            events.append(
-                TrafikinfoEvent(
-                    situation_id=situation_id,
-                    deviation_id=_strip(_findtext(dev, "./Id")),
-                    icon_id=_strip(_findtext(dev, "./IconId")),
-                    message_type=_strip(_findtext(dev, "./MessageType")),
-                    message_type_value=_strip(_findtext(dev, "./MessageTypeValue")),
-                    header=_strip(_findtext(dev, "./Header")),
-                    message=_strip(_findtext(dev, "./Message")),
-                    severity_code=_as_int(_findtext(dev, "./SeverityCode")),
-                    severity_text=_strip(_findtext(dev, "./SeverityText")),
-                    road_number=_strip(_findtext(dev, "./RoadNumber")),
-                    road_name=_strip(_findtext(dev, "./RoadName")),
-                    county_no=county_no,
-                    affected_direction=_strip(_findtext(dev, "./AffectedDirection")),
-                    affected_direction_value=_strip(
-                        _findtext(dev, "./AffectedDirectionValue")
-                    ),
-                    start_time=start_time,
-                    end_time=end_time,
-                    valid_until_further_notice=_as_bool(
-                        _findtext(dev, "./ValidUntilFurtherNotice")
-                    ),
-                    suspended=suspended,
-                    location_descriptor=_strip(_findtext(dev, "./LocationDescriptor")),
-                    positional_description=_strip(
-                        _findtext(dev, "./PositionalDescription")
-                    ),
-                    traffic_restriction_type=_strip(
-                        _findtext(dev, "./TrafficRestrictionType")
-                    ),
-                    temporary_limit=_strip(_findtext(dev, "./TemporaryLimit")),
-                    number_of_lanes_restricted=_as_int(
-                        _findtext(dev, "./NumberOfLanesRestricted")
-                    ),
-                    safety_related_message=_as_bool(
-                        _findtext(dev, "./SafetyRelatedMessage")
-                    ),
-                    weblink=_strip(_findtext(dev, "./WebLink")),
-                    geometry_wgs84=geom_wgs84,
-                    version_time=version_time,
-                    publication_time=pub_time,
-                    modified_time=modified_time,
-                )
-            )
 
+def _finalize_data(
+    events: list[TrafikinfoEvent],
+    last_modified: datetime | None,
+    last_change_id: str | None,
+    sse_url: str | None,
+    situation_count: int,
+    deviation_count: int,
+) -> TrafikinfoData:
     _LOGGER.debug(
         "Parsed Trafikverket response: situations=%s deviations=%s events_active=%s",
         situation_count,
@@ -391,14 +595,21 @@ def _parse_response(xml_text: str) -> TrafikinfoData:
     )
 
     # A stable-ish order: newest first by publication_time, then id.
-    def _sort_key(e: TrafikinfoEvent):
-        return (
-            e.publication_time or datetime.min.replace(tzinfo=dt_util.UTC),
-            e.situation_id or "",
-            e.deviation_id or "",
+    # Sort on the integer epoch rather than datetime objects — datetime
+    # comparison is Python-level and noticeably slower at 10k+ events.
+    decorated = [
+        (
+            (
+                int(pub.timestamp()) if (pub := e.publication_time) else 0,
+                e.situation_id or "",
+                e.deviation_id or "",
+            ),
+            e,
         )
-
-    events.sort(key=_sort_key, reverse=True)
+        for e in events
+    ]
+    decorated.sort(key=itemgetter(0), reverse=True)
+    events = [e for _, e in decorated]
 
     return TrafikinfoData(
         events=events,
@@ -408,12 +619,228 @@ def _parse_response(xml_text: str) -> TrafikinfoData:
     )
 
 
+def _parse_response_iterparse(xml_data: bytes) -> TrafikinfoData:
+    # Single streaming pass over the document. The response can contain
+    # thousands of Situations; collecting child texts into plain dicts as the
+    # end events fire avoids repeated namespace-wildcard `find()` scans per
+    # field, which dominated parse time with the old DOM approach.
+    last_modified: datetime | None = None
+    last_change_id: str | None = None
+    sse_url: str | None = None
+    err_msg: str | None = None
+
+    now = dt_util.utcnow()
+    events: list[TrafikinfoEvent] = []
+    situation_count = 0
+    deviation_count = 0
+
+    stack: list[str] = []
+    sit: dict[str, str | None] | None = None
+    sit_devs: list[tuple[dict[str, str | None], list[int], str | None]] = []
+    dev: dict[str, str | None] | None = None
+    counties: list[int] = []
+    wgs84: str | None = None
+
+    try:
+        for ev, elem in _iterparse(xml_data):
+            local = elem.tag.rpartition("}")[2]
+            if ev == "start":
+                stack.append(local)
+                if local == "Situation":
+                    sit = {}
+                    sit_devs = []
+                elif local == "Deviation" and sit is not None:
+                    dev = {}
+                    counties = []
+                    wgs84 = None
+                continue
+
+            stack.pop()
+            parent = stack[-1] if stack else ""
+            text = elem.text
+
+            if dev is not None:
+                if local == "Deviation":
+                    sit_devs.append((dev, counties, _strip(wgs84)))
+                    dev = None
+                elif parent == "Deviation":
+                    dev[local] = text
+                    if local == "CountyNo":
+                        val = _as_int(text)
+                        if val is not None:
+                            counties.append(val)
+                elif local == "WGS84" and wgs84 is None and "Geometry" in stack:
+                    wgs84 = text
+                continue
+
+            if sit is not None:
+                if local == "Situation":
+                    situation_count += 1
+                    deviation_count += _process_situation(sit, sit_devs, events, now)
+                    sit = None
+                    sit_devs = []
+                    elem.clear()
+                    if LET is not None:
+                        # lxml keeps cleared siblings attached to the root;
+                        # drop them too so memory stays flat per Situation.
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                elif parent == "Situation":
+                    sit[local] = text
+                continue
+
+            if parent == "ERROR" and local == "MESSAGE":
+                err_msg = text
+            elif parent == "INFO":
+                if local == "LASTMODIFIED":
+                    dt_raw = elem.attrib.get("datetime")
+                    last_modified = dt_util.parse_datetime(dt_raw) if dt_raw else None
+                elif local == "LASTCHANGEID":
+                    last_change_id = _strip(text)
+                elif local == "SSEURL":
+                    sse_url = _strip(text)
+    except _PARSE_ERRORS as err:
+        raise TrafikinfoParseError(f"Invalid XML from Trafikverket: {err}") from err
+
+    _raise_for_error(err_msg)
+    return _finalize_data(
+        events, last_modified, last_change_id, sse_url, situation_count, deviation_count
+    )
+
+
+def _parse_response_expat(xml_data: bytes) -> TrafikinfoData:
+    # SAX-style variant of _parse_response_iterparse for installs without
+    # lxml: expat callbacks never materialize element objects at all, which
+    # is both faster than stdlib iterparse and keeps peak memory flat.
+    last_modified: datetime | None = None
+    last_change_id: str | None = None
+    sse_url: str | None = None
+    err_msg: str | None = None
+
+    now = dt_util.utcnow()
+    events: list[TrafikinfoEvent] = []
+    situation_count = 0
+    deviation_count = 0
+
+    stack: list[str] = []
+    buf: list[str] = []
+    sit: dict[str, str | None] | None = None
+    sit_devs: list[tuple[dict[str, str | None], list[int], str | None]] = []
+    dev: dict[str, str | None] | None = None
+    counties: list[int] = []
+    wgs84: str | None = None
+
+    def _start(name: str, attrs: dict[str, str]) -> None:
+        nonlocal sit, sit_devs, dev, counties, wgs84, last_modified
+        local = name.rpartition("}")[2]
+        stack.append(local)
+        buf.clear()
+        if local == "Situation":
+            sit = {}
+            sit_devs = []
+        elif local == "Deviation" and sit is not None:
+            dev = {}
+            counties = []
+            wgs84 = None
+        elif (
+            local == "LASTMODIFIED" and len(stack) >= 2 and stack[-2] == "INFO"
+        ):
+            dt_raw = attrs.get("datetime")
+            last_modified = dt_util.parse_datetime(dt_raw) if dt_raw else None
+
+    def _chardata(data: str) -> None:
+        buf.append(data)
+
+    def _end(name: str) -> None:
+        nonlocal sit, sit_devs, dev, wgs84
+        nonlocal situation_count, deviation_count
+        nonlocal last_change_id, sse_url, err_msg
+        local = name.rpartition("}")[2]
+        stack.pop()
+        parent = stack[-1] if stack else ""
+        text = "".join(buf) if buf else None
+        buf.clear()
+
+        if dev is not None:
+            if local == "Deviation":
+                sit_devs.append((dev, counties, _strip(wgs84)))
+                dev = None
+            elif parent == "Deviation":
+                dev[local] = text
+                if local == "CountyNo":
+                    val = _as_int(text)
+                    if val is not None:
+                        counties.append(val)
+            elif local == "WGS84" and wgs84 is None and "Geometry" in stack:
+                wgs84 = text
+            return
+
+        if sit is not None:
+            if local == "Situation":
+                situation_count += 1
+                deviation_count += _process_situation(sit, sit_devs, events, now)
+                sit = None
+                sit_devs = []
+            elif parent == "Situation":
+                sit[local] = text
+            return
+
+        if parent == "ERROR" and local == "MESSAGE":
+            err_msg = text
+        elif parent == "INFO":
+            if local == "LASTCHANGEID":
+                last_change_id = _strip(text)
+            elif local == "SSEURL":
+                sse_url = _strip(text)
+
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.buffer_text = True
+    parser.StartElementHandler = _start
+    parser.EndElementHandler = _end
+    parser.CharacterDataHandler = _chardata
+    try:
+        parser.Parse(xml_data, True)
+    except expat.ExpatError as err:
+        raise TrafikinfoParseError(f"Invalid XML from Trafikverket: {err}") from err
+
+    _raise_for_error(err_msg)
+    return _finalize_data(
+        events, last_modified, last_change_id, sse_url, situation_count, deviation_count
+    )
+
+
+# Feature flag: the iterparse path (which is also the lxml fast path) can be
+# forced by flipping this, e.g. when debugging parser differences.
+_USE_EXPAT = True
+
+
+def _parse_response(xml_data: bytes | str) -> TrafikinfoData:
+    # The parsers consume UTF-8 bytes; accepting str keeps callers that hold
+    # decoded text (e.g. tests) working without a second code path.
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+    if LET is None and _USE_EXPAT:
+        return _parse_response_expat(xml_data)
+    return _parse_response_iterparse(xml_data)
+
+
 class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
     """Fetch and parse Trafikverket Situation data."""
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self._entry = entry
         self._api_key = str(entry.data.get(CONF_API_KEY, "")).strip()
+        # The request body and POST headers only depend on the API key and
+        # this install, so build them once instead of on every poll.
+        self._xml_request_bytes = (
+            _build_request_xml(self._api_key, limit=5000).encode("utf-8")
+            if self._api_key
+            else b""
+        )
+        self._post_headers = {
+            "Content-Type": "text/xml; charset=utf-8",
+            "User-Agent": get_user_agent(hass),
+        }
         self._max_items = int(
             entry.options.get(
                 CONF_MAX_ITEMS, entry.data.get(CONF_MAX_ITEMS, DEFAULT_MAX_ITEMS)
@@ -430,6 +857,7 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
             raw_roads = parts
         if isinstance(raw_roads, list):
             self._filter_roads = [str(x).strip() for x in raw_roads if str(x).strip()]
+        self._recompute_road_tokens()
         self._road_filter_safety_bypass: bool = bool(
             entry.options.get(
                 CONF_ROAD_FILTER_SAFETY_BYPASS,
@@ -505,6 +933,64 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
             )
         )
         self._icon_local_urls: dict[str, str] = {}
+        # Bumped whenever the local icon URL map gains entries, so entities
+        # can cheaply detect that cached picture URLs are stale.
+        self._icons_version = 0
+        # icon_id -> ETag from the icon endpoint, persisted in one JSON
+        # manifest next to the cached files (loaded lazily on first use).
+        self._icon_etags: dict[str, str] | None = None
+        # icon_id -> cached filename, persisted in the same manifest so local
+        # URLs survive restarts without re-probing the icon endpoint.
+        self._icon_files: dict[str, str] | None = None
+        self._icon_manifest_dirty = False
+        # filename -> size for the icon cache dir, built with one scandir so
+        # per-icon existence checks don't stat the filesystem every refresh.
+        self._icon_cache_index: dict[str, int] | None = None
+        # Dedicated session for icon downloads (created lazily, closed in
+        # async_shutdown); see _get_icon_session.
+        self._icon_session: aiohttp.ClientSession | None = None
+        # icon_id -> monotonic deadline until which the icon is treated as
+        # missing (negative cache for definitive 404 / non-image answers).
+        self._icon_missing: dict[str, float] = {}
+        # HTTP validators from the previous Datacache response, used for
+        # conditional requests so unchanged polls skip transfer + parse.
+        self._http_last_modified: str | None = None
+        self._http_etag: str | None = None
+        # Distance LRU keyed by (situation_id, deviation_id, version_time):
+        # geometries rarely change between polls, so distances survive across
+        # refresh cycles and invalidate themselves when an event is updated.
+        self._dist_lru: OrderedDict[
+            tuple[str | None, str | None, datetime | None], float | None
+        ] = OrderedDict()
+        # Parsed-geometry cache keyed by the (immutable) WKT string itself.
+        # _in_radius and event_distance_km both tokenize geometries on every
+        # refresh, while the strings rarely change between polls; parsing each
+        # distinct WKT once per cache lifetime amortizes the string scan.
+        self._wkt_lru: OrderedDict[
+            str,
+            tuple[
+                list[tuple[float, float]], tuple[float, float, float, float] | None
+            ],
+        ] = OrderedDict()
+        # Rendered dict form of events, shared by attribute rendering and the
+        # incident event bus. Keyed like the distance LRU so entries
+        # self-invalidate when an event is updated upstream.
+        self._event_dict_lru: OrderedDict[
+            tuple[str | None, str | None, datetime | None, datetime | None],
+            dict[str, Any],
+        ] = OrderedDict()
+        # Per-update category grouping shared by all message-type sensors, so
+        # six entities don't each rescan the full event list on every read.
+        # Rebuilt lazily whenever self.data is replaced.
+        # Cached {"latitude", "longitude"} attribute dict, shared by sensors.
+        self._filter_center_cache: (
+            tuple[tuple[float, float], dict[str, float]] | None
+        ) = None
+
+        self._events_by_category: dict[str, list[TrafikinfoEvent]] = {}
+        self._counts_by_category: dict[str, int] = {}
+        self._sorted_by_category: dict[str, list[TrafikinfoEvent]] = {}
+        self._category_source: TrafikinfoData | None = None
 
         super().__init__(
             hass,
@@ -562,6 +1048,21 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
     def radius_km(self) -> float:
         return self._radius_km
 
+    def filter_center_attr(self) -> dict[str, float] | None:
+        """Shared lat/lon dict for sensor attributes, rebuilt only on change.
+
+        Every message-type sensor exposes the same filter center, so one
+        cached dict serves all attribute reads until options move it.
+        """
+        if self._filter_mode != FILTER_MODE_COORDINATE:
+            return None
+        key = (self._latitude, self._longitude)
+        cached = self._filter_center_cache
+        if cached is None or cached[0] != key:
+            cached = (key, {"latitude": self._latitude, "longitude": self._longitude})
+            self._filter_center_cache = cached
+        return cached[1]
+
     def apply_options(self) -> None:
         """Apply updated options from the config entry."""
         raw_roads = self._entry.options.get(
@@ -576,6 +1077,7 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
             self._filter_roads = [str(x).strip() for x in raw_roads if str(x).strip()]
         else:
             self._filter_roads = []
+        self._recompute_road_tokens()
         self._road_filter_safety_bypass = bool(
             self._entry.options.get(
                 CONF_ROAD_FILTER_SAFETY_BYPASS,
@@ -636,6 +1138,7 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
             )
         )
         # Recompute sorting reference point
+        prev_sort_ref = (self._sort_latitude, self._sort_longitude)
         if self._filter_mode == FILTER_MODE_COORDINATE:
             self._sort_latitude = float(self._latitude)
             self._sort_longitude = float(self._longitude)
@@ -657,6 +1160,11 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
             else:
                 self._sort_latitude = float(self.hass.config.latitude)
                 self._sort_longitude = float(self.hass.config.longitude)
+        if (self._sort_latitude, self._sort_longitude) != prev_sort_ref:
+            # Cached distances are relative to the old reference point.
+            self._dist_lru.clear()
+        # Sort settings may have changed; drop cached per-category orderings.
+        self._sorted_by_category = {}
 
     def _is_important_without_geo(self, event: TrafikinfoEvent) -> bool:
         if event.message_type == "Viktig trafikinformation":
@@ -670,21 +1178,25 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
         if not s:
             return ""
         # Allow user-friendly inputs like "Väg 163" / "Road 163" by stripping the prefix.
-        s = re.sub(r"^(väg|vag|road)\s+", "", s, flags=re.IGNORECASE)
+        s = _ROAD_PREFIX_RE.sub("", s)
         # Normalize whitespace
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _WS_RE.sub(" ", s).strip()
         return s
 
-    def _road_filter_match(self, event: TrafikinfoEvent, tokens: list[str]) -> bool:
-        if not tokens:
+    def _recompute_road_tokens(self) -> None:
+        """Normalize the configured road filter once, for the per-event hot path."""
+        tokens = [self._normalize_road_filter_token(x) for x in self._filter_roads]
+        self._road_tokens: tuple[str, ...] = tuple(t for t in tokens if t)
+        self._road_token_set: frozenset[str] = frozenset(self._road_tokens)
+
+    def _road_filter_match(self, event: TrafikinfoEvent) -> bool:
+        if not self._road_tokens:
             return True
-        road_text = f"{event.road_name or ''} {event.road_number or ''}".lower()
         road_no = (event.road_number or "").strip().lower()
-        for t in tokens:
-            if not t:
-                continue
-            if road_no and t == road_no:
-                return True
+        if road_no and road_no in self._road_token_set:
+            return True
+        road_text = f"{event.road_name or ''} {event.road_number or ''}".lower()
+        for t in self._road_tokens:
             if t in road_text:
                 return True
         return False
@@ -693,106 +1205,197 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
         self, events: list[TrafikinfoEvent]
     ) -> list[TrafikinfoEvent]:
         """Apply road filter, but never drop important safety/national messages."""
-        if not self._filter_roads:
-            return events
-        tokens = [self._normalize_road_filter_token(x) for x in self._filter_roads]
-        tokens = [t for t in tokens if t]
-        if not tokens:
+        if not self._road_tokens:
             return events
         out: list[TrafikinfoEvent] = []
         for e in events:
             if self._is_important_without_geo(e):
                 out.append(e)
                 continue
-            if self._road_filter_match(e, tokens):
+            if self._road_filter_match(e):
                 out.append(e)
         return out
 
+    _DIST_LRU_MAX = 4096
+
     def event_distance_km(self, event: TrafikinfoEvent) -> float | None:
         """Compute min distance (km) from sorting reference to event geometry."""
         if not event.geometry_wgs84:
             return None
-        pts = self._wkt_points(event.geometry_wgs84)
-        if not pts:
-            return None
+
+        lru_key = (event.situation_id, event.deviation_id, event.version_time)
+        lru = self._dist_lru
+        if lru_key in lru:
+            lru.move_to_end(lru_key)
+            return lru[lru_key]
+
+        dist = self._event_distance_km_uncached(event)
+        lru[lru_key] = dist
+        while len(lru) > self._DIST_LRU_MAX:
+            lru.popitem(last=False)
+        return dist
+
+    def _event_distance_km_uncached(self, event: TrafikinfoEvent) -> float | None:
         center_lon = float(self._sort_longitude)
         center_lat = float(self._sort_latitude)
+
+        pts, bbox = self._wkt_geometry(event.geometry_wgs84)
+        if not pts:
+            return None
+
+        # Coarse short-circuit for far geometries: the center clamped into
+        # the bbox lower-bounds the distance to every vertex, so only when
+        # even that bound exceeds the sorting-relevant range is the
+        # first-vertex flat-earth distance good enough to skip the full
+        # haversine scan. A single far vertex alone proves nothing — a line
+        # can start far away and still dip into the radius.
+        if bbox is not None and len(pts) > 1:
+            min_lon, max_lon, min_lat, max_lat = bbox
+            near_lon = min(max(center_lon, min_lon), max_lon)
+            near_lat = min(max(center_lat, min_lat), max_lat)
+            if _equirect_km(center_lon, center_lat, near_lon, near_lat) > max(
+                self._radius_km * 3, 50.0
+            ):
+                lon0, lat0 = pts[0]
+                return _equirect_km(center_lon, center_lat, lon0, lat0)
         best: float | None = None
         for lon, lat in pts[:200]:  # cap work for huge geometries
-            d = self._haversine_km(center_lon, center_lat, lon, lat)
+            d = _haversine_km(center_lon, center_lat, lon, lat)
             if best is None or d < best:
                 best = d
         return best
 
+    _EVENT_DICT_LRU_MAX = 2048
+
+    def event_as_dict(self, event: TrafikinfoEvent) -> dict[str, Any]:
+        """Cached dict form of an event.
+
+        The returned dict is shared: callers that add keys must copy it first
+        (``dict(coordinator.event_as_dict(e))``). Events are immutable after
+        parse, so the rendering (including the datetime isoformat calls) only
+        needs to happen once per event version.
+        """
+        key = (
+            event.situation_id,
+            event.deviation_id,
+            event.version_time,
+            event.modified_time,
+        )
+        lru = self._event_dict_lru
+        if key in lru:
+            lru.move_to_end(key)
+            return lru[key]
+
+        d = event.as_dict()
+        lru[key] = d
+        while len(lru) > self._EVENT_DICT_LRU_MAX:
+            lru.popitem(last=False)
+        return d
+
+    def events_by_category(self, category: str) -> list[TrafikinfoEvent]:
+        """Return the current events grouped under one stable category.
+
+        The grouping is computed in a single pass over the event list and
+        cached until the coordinator data is replaced, so every sensor read
+        reuses the same dict instead of rescanning all events.
+        """
+        data = self.data
+        if data is None:
+            return []
+        if self._category_source is not data:
+            by_cat: dict[str, list[TrafikinfoEvent]] = {}
+            # Bind the loop's lookups to locals once: attribute and global
+            # resolution per event adds up on feeds with thousands of events.
+            setdefault = by_cat.setdefault
+            categorize = _categorize
+            for event in data.events:
+                # Events here are always TrafikinfoEvent (slots), so read the
+                # fields directly instead of paying getattr-with-default per
+                # event; category is precomputed at parse time and only falls
+                # back to the resolver for restored/legacy events.
+                cat = event.category or categorize(
+                    event.message_type, event.message_type_value
+                )
+                if cat is not None:
+                    setdefault(cat, []).append(event)
+            self._events_by_category = by_cat
+            self._counts_by_category = {k: len(v) for k, v in by_cat.items()}
+            self._sorted_by_category = {}
+            self._category_source = data
+        return self._events_by_category.get(category, [])
+
+    def category_count(self, category: str) -> int:
+        """Return the number of current events in one category, O(1)."""
+        data = self.data
+        if data is None:
+            return 0
+        if self._category_source is not data:
+            # Rebuild the buckets (and counts) for the new data snapshot.
+            self.events_by_category(category)
+        return self._counts_by_category.get(category, 0)
+
+    def sorted_events_by_category(self, category: str) -> list[TrafikinfoEvent]:
+        """Like events_by_category, but sorted; sorted once per update."""
+        events = self.events_by_category(category)
+        cache = self._sorted_by_category
+        if category not in cache:
+            cache[category] = self.sort_events(events)
+        return cache[category]
+
     def sort_events(self, events: list[TrafikinfoEvent]) -> list[TrafikinfoEvent]:
         """Sort events according to configured sort_mode."""
         if not events:
             return []
 
-        def _pub_ts(e: TrafikinfoEvent) -> float:
-            pub = e.publication_time
-            if not isinstance(pub, datetime):
-                return 0.0
-            try:
-                return float(pub.timestamp())
-            except Exception:
-                return 0.0
+        # Schwartzian transform: build each key exactly once, then sort the
+        # (key, event) pairs with itemgetter instead of invoking a key
+        # callable O(N log N) times.
+        decorated: list[tuple[tuple, TrafikinfoEvent]] = []
 
         if self._sort_mode == SORT_MODE_NEWEST:
             # Already newest-first globally, but filter may disturb ordering in future;
             # make it explicit and stable.
-            def _k_newest(e: TrafikinfoEvent):
-                return (
-                    e.publication_time or datetime.min.replace(tzinfo=dt_util.UTC),
-                    e.situation_id or "",
-                    e.deviation_id or "",
+            dt_min = datetime.min.replace(tzinfo=dt_util.UTC)
+            decorated = [
+                (
+                    (
+                        e.publication_time or dt_min,
+                        e.situation_id or "",
+                        e.deviation_id or "",
+                    ),
+                    e,
                 )
+                for e in events
+            ]
+            decorated.sort(key=itemgetter(0), reverse=True)
+            return [e for _, e in decorated]
+
+        # Nearest / relevance need distances; event_distance_km is backed by
+        # the coordinator-level LRU, so repeated lookups are cheap.
+        # The whole rank fits in one int (important bit, missing-distance bit,
+        # distance at ~1 m resolution, inverted publication epoch), so the
+        # sort compares C-level ints instead of tuples. Rare exact ties fall
+        # back to input order thanks to the stable sort (newest-first from
+        # the parse step).
+        relevance = self._sort_mode != SORT_MODE_NEAREST
+        packed: list[tuple[int, TrafikinfoEvent]] = []
+        for e in events:
+            d = self.event_distance_km(e)
+            pub = e.publication_time
+            ts = int(pub.timestamp()) if isinstance(pub, datetime) else 0
+            if d is None:
+                # Unknown distances sort after known ones.
+                key = (1 << _MISSING_DIST_SHIFT) | (_DIST_KEY_MASK << 32)
+            else:
+                key = min(int(d * 1000), _DIST_KEY_MASK) << 32
+            key |= (0xFFFFFFFF - ts) & 0xFFFFFFFF  # newest first
+            if relevance and not self._is_important_without_geo(e):
+                # Important messages first, regardless of distance.
+                key |= 1 << _IMPORTANT_SHIFT
+            packed.append((key, e))
 
-            return sorted(events, key=_k_newest, reverse=True)
-
-        # Nearest / relevance need distances. Cache per call (avoid recompute per key element).
-        dist_cache: dict[tuple[str | None, str | None], float | None] = {}
-
-        def _dist(e: TrafikinfoEvent) -> float | None:
-            key = (e.situation_id, e.deviation_id)
-            if key in dist_cache:
-                return dist_cache[key]
-            dist_cache[key] = self.event_distance_km(e)
-            return dist_cache[key]
-
-        def _k_nearest(e: TrafikinfoEvent):
-            d = _dist(e)
-            missing = 1 if d is None else 0  # known distances first
-            dval = float(d) if d is not None else float("inf")
-            # Newest first as tie-breaker
-            return (
-                missing,
-                dval,
-                -_pub_ts(e),
-                e.situation_id or "",
-                e.deviation_id or "",
-            )
-
-        if self._sort_mode == SORT_MODE_NEAREST:
-            return sorted(events, key=_k_nearest, reverse=False)
-
-        # Default: relevance (important first, then nearest, then newest)
-        def _k_relevance(e: TrafikinfoEvent):
-            important = 0 if self._is_important_without_geo(e) else 1
-            d = _dist(e)
-            missing = 1 if d is None else 0
-            dval = float(d) if d is not None else float("inf")
-            # Newest first within same bucket:
-            return (
-                important,
-                missing,
-                dval,
-                -_pub_ts(e),
-                e.situation_id or "",
-                e.deviation_id or "",
-            )
-
-        return sorted(events, key=_k_relevance, reverse=False)
+        packed.sort(key=itemgetter(0))
+        return [e for _, e in packed]
 
     def _in_counties(self, event: TrafikinfoEvent) -> bool:
         if COUNTY_ALL in self._counties:
@@ -836,6 +1439,13 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
         return f"{safe}.{ext}"
 
     async def _async_write_file(self, path: Path, content: bytes) -> None:
+        """Write a file atomically (temp file + os.replace rename).
+
+        Readers (e.g. browsers fetching /local/ icons) either see the old
+        file or the complete new one, never a half-written image - which is
+        what lets _icon_local_urls be trusted without per-render stat calls.
+        """
+
         def _write() -> None:
             path.parent.mkdir(parents=True, exist_ok=True)
             tmp = path.with_suffix(path.suffix + ".tmp")
@@ -844,9 +1454,173 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
 
         await self.hass.async_add_executor_job(_write)
 
-    async def _ensure_icon_cached(self, icon_id: str) -> None:
+    async def _async_load_icon_cache_index(self) -> None:
+        """Build the icon cache directory index with a single scandir (once)."""
+        if self._icon_cache_index is not None:
+            return
+
+        def _scan() -> dict[str, int]:
+            index: dict[str, int] = {}
+            try:
+                with os.scandir(self._icon_cache_dir()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_file():
+                                index[entry.name] = entry.stat().st_size
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            return index
+
+        self._icon_cache_index = await self.hass.async_add_executor_job(_scan)
+
+    def _icon_file_nonempty(self, name: str, path: Path) -> bool:
+        idx = self._icon_cache_index
+        if idx is not None:
+            return idx.get(name, 0) > 0
+        return _file_nonempty(path)
+
+    def _icon_file_empty_on_disk(self, name: str, path: Path) -> bool:
+        idx = self._icon_cache_index
+        if idx is not None:
+            return idx.get(name) == 0
+        return path.exists() and not _file_nonempty(path)
+
+    def _get_icon_session(self) -> aiohttp.ClientSession:
+        """Session used for the many small icon GETs against one host.
+
+        Unlike the shared HA session this one pins per-host connection limits
+        and keepalive, so repeated icon batches reuse warm connections
+        instead of re-handshaking.
+        """
+        if self._icon_session is None or self._icon_session.closed:
+            self._icon_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=8,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+                headers={"User-Agent": get_user_agent(self.hass)},
+            )
+        return self._icon_session
+
+    async def async_shutdown(self) -> None:
+        """Close the dedicated icon session along with the coordinator."""
+        if self._icon_session is not None and not self._icon_session.closed:
+            await self._icon_session.close()
+        await super().async_shutdown()
+
+    @property
+    def icons_version(self) -> int:
+        """Monotonic counter that changes when local icon URLs change."""
+        return self._icons_version
+
+    def _register_icon_file(self, icon_id: str, name: str) -> None:
+        """Record a cached icon file both in memory and for the manifest."""
+        self._icon_local_urls[icon_id] = f"/local/{ICON_CACHE_DIR}/{name}"
+        self._icons_version += 1
+        if self._icon_files is None:
+            self._icon_files = {}
+        if self._icon_files.get(icon_id) != name:
+            self._icon_files[icon_id] = name
+            self._icon_manifest_dirty = True
+
+    def _icon_manifest_path(self) -> Path:
+        return self._icon_cache_dir() / "manifest.json"
+
+    async def _async_load_icon_manifest(self) -> None:
+        """Load the icon manifest (ETags + icon_id -> filename) from disk (once)."""
+        if self._icon_etags is not None:
+            return
+
+        def _str_dict(raw: Any, key: str) -> dict[str, str]:
+            section = raw.get(key) if isinstance(raw, dict) else None
+            if not isinstance(section, dict):
+                return {}
+            return {
+                str(k): str(v)
+                for k, v in section.items()
+                if isinstance(k, str) and isinstance(v, str)
+            }
+
+        def _load() -> tuple[dict[str, str], dict[str, str]]:
+            try:
+                raw = json.loads(self._icon_manifest_path().read_text("utf-8"))
+            except (OSError, ValueError):
+                return {}, {}
+            return _str_dict(raw, "etags"), _str_dict(raw, "files")
+
+        self._icon_etags, self._icon_files = await self.hass.async_add_executor_job(
+            _load
+        )
+
+        # Seed the local-URL map from the manifest: icons already present on
+        # disk (verified against the scandir index) need no HTTP round trip
+        # after a restart.
+        cache_dir = self._icon_cache_dir()
+        seeded = False
+        for icon_id, name in self._icon_files.items():
+            if icon_id not in self._icon_local_urls and self._icon_file_nonempty(
+                name, cache_dir / name
+            ):
+                self._icon_local_urls[icon_id] = f"/local/{ICON_CACHE_DIR}/{name}"
+                seeded = True
+        if seeded:
+            self._icons_version += 1
+
+    async def _async_save_icon_manifest(self) -> None:
+        if not self._icon_manifest_dirty or self._icon_etags is None:
+            return
+        self._icon_manifest_dirty = False
+        payload = json.dumps(
+            {"etags": self._icon_etags, "files": self._icon_files or {}}
+        ).encode("utf-8")
+        try:
+            await self._async_write_file(self._icon_manifest_path(), payload)
+        except OSError as err:
+            _LOGGER.debug("Failed to write icon manifest: %s", err)
+
+    async def _async_write_files(
+        self, items: list[tuple[Path, bytes]]
+    ) -> list[Path]:
+        """Write many files in one executor job; return the paths that failed."""
+        if not items:
+            return []
+
+        def _write_all() -> list[Path]:
+            failed: list[Path] = []
+            made_dirs: set[Path] = set()
+            for path, content in items:
+                try:
+                    parent = path.parent
+                    if parent not in made_dirs:
+                        parent.mkdir(parents=True, exist_ok=True)
+                        made_dirs.add(parent)
+                    tmp = path.with_suffix(path.suffix + ".tmp")
+                    tmp.write_bytes(content)
+                    tmp.replace(path)
+                except OSError:
+                    failed.append(path)
+            return failed
+
+        return await self.hass.async_add_executor_job(_write_all)
+
+    async def _ensure_icon_cached(
+        self,
+        icon_id: str,
+        pending: list[tuple[str, str, Path, bytes]] | None = None,
+    ) -> None:
+        """Cache one icon; with `pending`, downloads are staged instead of written."""
         if icon_id in self._icon_local_urls:
             return
+        missing_until = self._icon_missing.get(icon_id)
+        if missing_until is not None:
+            if monotonic() < missing_until:
+                # The server answered definitively that this icon doesn't
+                # exist; don't re-GET it on every poll.
+                return
+            del self._icon_missing[icon_id]
 
         cache_dir = self._icon_cache_dir()
         # Default to png; we may switch to svg if response indicates it.
@@ -855,19 +1629,23 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
         png_path = cache_dir / png_name
         svg_path = cache_dir / svg_name
 
-        if _file_nonempty(png_path):
-            self._icon_local_urls[icon_id] = f"/local/{ICON_CACHE_DIR}/{png_name}"
+        if self._icon_file_nonempty(png_name, png_path):
+            self._register_icon_file(icon_id, png_name)
             return
-        if _file_nonempty(svg_path):
-            self._icon_local_urls[icon_id] = f"/local/{ICON_CACHE_DIR}/{svg_name}"
+        if self._icon_file_nonempty(svg_name, svg_path):
+            self._register_icon_file(icon_id, svg_name)
             return
         # If we have empty/partial files from earlier runs, delete and re-download.
-        if png_path.exists() and not _file_nonempty(png_path):
+        if self._icon_file_empty_on_disk(png_name, png_path):
             await self.hass.async_add_executor_job(_try_unlink, png_path)
-        if svg_path.exists() and not _file_nonempty(svg_path):
+            if self._icon_cache_index is not None:
+                self._icon_cache_index.pop(png_name, None)
+        if self._icon_file_empty_on_disk(svg_name, svg_path):
             await self.hass.async_add_executor_job(_try_unlink, svg_path)
+            if self._icon_cache_index is not None:
+                self._icon_cache_index.pop(svg_name, None)
 
-        session = aiohttp_client.async_get_clientsession(self.hass)
+        session = self._get_icon_session()
 
         # Prefer v2 icon URL (matches Icon dataset Url field).
         url_v2 = self.get_remote_icon_url(icon_id)
@@ -876,166 +1654,305 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
             f"{TRAFIKVERKET_ICONS_BASE_URL}/{quote(icon_id, safe='')}?type=png32x32"
         )
 
-        for url in (url_v2, url_v1):
-            if not url:
-                continue
+        # User-Agent is set once on the session.
+        etag = (self._icon_etags or {}).get(icon_id)
+        headers = {"If-None-Match": etag} if etag else None
+
+        # Set when the server answered definitively (404, non-image 200, ...)
+        # rather than transiently (5xx, timeout): only definitive misses are
+        # negative-cached.
+        definitive_miss = False
+
+        urls = [u for u in (url_v2, url_v1) if u]
+        i = 0
+        while i < len(urls):
+            url = urls[i]
+            i += 1
             try:
-                async with async_timeout.timeout(15):
-                    async with session.get(
-                        url,
-                        headers={"User-Agent": get_user_agent(self.hass)},
-                    ) as resp:
-                        if resp.status != 200:
-                            continue
-                        content = await resp.read()
-                        ctype = (resp.headers.get("Content-Type") or "").lower()
-                        # Only cache if the payload looks like an actual image.
-                        # Some endpoints can return JSON error payloads with 200/4xx;
-                        # don't write those to disk as .png/.svg.
-                        if ("svg" in ctype) or _looks_like_svg(content):
-                            if not _looks_like_svg(content):
-                                continue
-                            await self._async_write_file(svg_path, content)
-                            self._icon_local_urls[icon_id] = (
-                                f"/local/{ICON_CACHE_DIR}/{svg_name}"
-                            )
-                        elif ("png" in ctype) or _looks_like_png(content):
-                            if not _looks_like_png(content):
-                                continue
-                            await self._async_write_file(png_path, content)
-                            self._icon_local_urls[icon_id] = (
-                                f"/local/{ICON_CACHE_DIR}/{png_name}"
-                            )
-                        else:
+                # aiohttp's own timeout covers connect + read without the
+                # extra wrapper task (and cancel scope) async_timeout adds.
+                async with session.get(
+                    url, headers=headers, timeout=_ICON_FETCH_TIMEOUT
+                ) as resp:
+                    if resp.status == 304:
+                        # Unchanged on the server; register whatever we
+                        # already have on disk instead of re-downloading.
+                        if self._icon_file_nonempty(png_name, png_path):
+                            self._register_icon_file(icon_id, png_name)
+                            return
+                        if self._icon_file_nonempty(svg_name, svg_path):
+                            self._register_icon_file(icon_id, svg_name)
+                            return
+                        # 304 with nothing usable on disk: the cached file
+                        # is gone but the manifest kept its ETag. Drop the
+                        # stale ETag and retry this URL unconditionally so
+                        # the icon isn't stuck validating a ghost file
+                        # forever.
+                        if self._icon_etags:
+                            self._icon_etags.pop(icon_id, None)
+                            self._icon_manifest_dirty = True
+                        if headers is not None:
+                            headers = None
+                            i -= 1
+                        continue
+                    if resp.status == 404:
+                        # Known-missing on this endpoint; the fallback may
+                        # still have it.
+                        definitive_miss = True
+                        continue
+                    if resp.status != 200:
+                        if resp.status in (408, 429) or resp.status >= 500:
+                            # Timeout / rate limit / 5xx: transient - try the
+                            # fallback and leave the icon eligible for the
+                            # next poll.
                             continue
-                        return
+                        # Other 4xx: the server rejected the request;
+                        # retrying the fallback URL won't change that.
+                        definitive_miss = True
+                        break
+                    content = await resp.read()
+                    # Only cache if the payload looks like an actual image.
+                    # Some endpoints can return JSON error payloads with 200/4xx;
+                    # don't write those to disk as .png/.svg. The sniff is the
+                    # authority either way, so the Content-Type header adds
+                    # nothing: classify the bytes once.
+                    kind = _sniff_image(content)
+                    if kind == "svg":
+                        name, path = svg_name, svg_path
+                    elif kind == "png":
+                        name, path = png_name, png_path
+                    else:
+                        # The canonical endpoint answered 200 with a
+                        # non-image payload (typically a JSON "not found");
+                        # the v1 retry won't do better.
+                        definitive_miss = True
+                        break
+                    if pending is not None:
+                        # Batched mode: the caller flushes all staged
+                        # writes in a single executor job.
+                        pending.append((icon_id, name, path, content))
+                    else:
+                        await self._async_write_file(path, content)
+                        if self._icon_cache_index is not None:
+                            self._icon_cache_index[name] = len(content)
+                        self._register_icon_file(icon_id, name)
+                    new_etag = resp.headers.get("ETag")
+                    if new_etag:
+                        if self._icon_etags is None:
+                            self._icon_etags = {}
+                        if self._icon_etags.get(icon_id) != new_etag:
+                            self._icon_etags[icon_id] = new_etag
+                            self._icon_manifest_dirty = True
+                    return
             except Exception:
                 continue
 
+        if definitive_miss:
+            self._icon_missing[icon_id] = monotonic() + _ICON_MISSING_TTL
+
     async def _ensure_icons_cached(self, icon_ids: list[str]) -> None:
         # Cache a limited number to avoid hammering the endpoint.
-        unique: list[str] = []
-        seen: set[str] = set()
-        for i in icon_ids:
-            if i in seen:
+        # dict.fromkeys dedups in one C-level pass while keeping order.
+        unique = list(dict.fromkeys(icon_ids))[:50]
+        if not unique:
+            return
+
+        # Fetch concurrently but stay polite: at most 8 requests in flight.
+        # Downloads are staged in memory and flushed to disk in one executor
+        # job afterwards, instead of one thread hop per icon.
+        sem = asyncio.Semaphore(8)
+        pending: list[tuple[str, str, Path, bytes]] = []
+
+        async def _one(icon_id: str) -> None:
+            async with sem:
+                await self._ensure_icon_cached(icon_id, pending)
+
+        async with asyncio.TaskGroup() as tg:
+            for icon_id in unique:
+                tg.create_task(_one(icon_id))
+
+        failed = set(
+            await self._async_write_files([(path, data) for _, _, path, data in pending])
+        )
+        for icon_id, name, path, data in pending:
+            if path in failed:
                 continue
-            seen.add(i)
-            unique.append(i)
-            if len(unique) >= 50:
-                break
-        for icon_id in unique:
-            await self._ensure_icon_cached(icon_id)
+            if self._icon_cache_index is not None:
+                self._icon_cache_index[name] = len(data)
+            self._register_icon_file(icon_id, name)
 
     async def _ensure_category_icons_cached(self) -> None:
         # Stable icons we want available even if current events have no IconId.
-        for icon_id in (
-            "roadAccident",
-            "trafficMessage",
-            "emergencyInformation",
-            "trafficMessagePlanned",
-        ):
-            await self._ensure_icon_cached(icon_id)
+        await self._ensure_icons_cached(
+            [
+                "roadAccident",
+                "trafficMessage",
+                "emergencyInformation",
+                "trafficMessagePlanned",
+            ]
+        )
 
     async def _cache_icons_background(self, icon_ids: list[str]) -> None:
         """Cache icons in background task to not block coordinator updates."""
         try:
+            await self._async_load_icon_cache_index()
+            await self._async_load_icon_manifest()
             await self._ensure_icons_cached(icon_ids)
             await self._ensure_category_icons_cached()
+            await self._async_save_icon_manifest()
         except Exception as err:
             _LOGGER.debug("Icon caching failed: %s", err)
 
+    _WKT_LRU_MAX = 1024
+
     def _wkt_points(self, wkt: str | None) -> list[tuple[float, float]]:
-        """Extract lon/lat points from common WKT shapes (POINT/LINESTRING/etc)."""
+        """Extract lon/lat points from common WKT shapes (POINT/LINESTRING/etc).
+
+        Results are cached per WKT string: geometries are immutable on the
+        event, so repeated filter/sort passes reuse the parsed point list.
+        """
+        return self._wkt_geometry(wkt)[0]
+
+    def _wkt_geometry(
+        self, wkt: str | None
+    ) -> tuple[list[tuple[float, float]], tuple[float, float, float, float] | None]:
+        """Return (points, bbox) for a WKT string, cached per string.
+
+        The bbox is (min_lon, max_lon, min_lat, max_lat), or None when the
+        geometry has no points; it is computed once here so radius checks can
+        reject far-away geometries with four comparisons.
+        """
         if not isinstance(wkt, str):
-            return []
+            return [], None
+
+        lru = self._wkt_lru
+        if wkt in lru:
+            lru.move_to_end(wkt)
+            return lru[wkt]
+
+        pts = self._wkt_points_uncached(wkt)
+        bbox = None
+        if pts:
+            lons = [p[0] for p in pts]
+            lats = [p[1] for p in pts]
+            bbox = (min(lons), max(lons), min(lats), max(lats))
+        entry = (pts, bbox)
+        lru[wkt] = entry
+        while len(lru) > self._WKT_LRU_MAX:
+            lru.popitem(last=False)
+        return entry
+
+    def _wkt_points_uncached(self, wkt: str) -> list[tuple[float, float]]:
         s = wkt.strip()
         if not s:
             return []
 
-        header = s.split("(", 1)[0].upper()
+        paren = s.find("(")
+        if paren < 0:
+            return []
+        header = s[:paren].upper()
         # WKT can be "POINT Z (...)" / "LINESTRING Z (...)" etc.
-        dim = 3 if " Z" in header or header.endswith("Z") else 2
+        dim = 3 if " Z" in header or header.rstrip().endswith("Z") else 2
 
-        nums = _WKT_NUMBER_RE.findall(s)
+        # Turn delimiters into whitespace and tokenize in C via str.split();
+        # float() over the token list avoids the regex findall intermediate.
+        tokens = s[paren:].translate(_WKT_DELIM_TRANS).split()
+        try:
+            floats = [float(t) for t in tokens]
+        except ValueError:
+            # Rare non-numeric token (e.g. "EMPTY"): fall back to skipping.
+            floats = []
+            for t in tokens:
+                try:
+                    floats.append(float(t))
+                except ValueError:
+                    continue
         # WKT is "X Y" (lon lat) pairs; Z may appear. We only use lon/lat.
-        if len(nums) < 2:
+        if len(floats) < 2:
             return []
 
-        floats: list[float] = []
-        for n in nums:
-            try:
-                floats.append(float(n))
-            except ValueError:
-                continue
-
-        pts: list[tuple[float, float]] = []
+        # Stride by slicing + zip (both C-level) instead of a Python loop.
         step = 3 if dim == 3 else 2
-        i = 0
-        while i + 1 < len(floats):
-            lon = floats[i]
-            lat = floats[i + 1]
-            pts.append((lon, lat))
-            i += step
-        return pts
-
-    def _haversine_km(
-        self, lon1: float, lat1: float, lon2: float, lat2: float
-    ) -> float:
-        r = 6371.0
-        p1 = math.radians(lat1)
-        p2 = math.radians(lat2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(p1) * math.cos(p2) * math.sin(dlon / 2) ** 2
-        )
-        return 2 * r * math.asin(math.sqrt(a))
+        return list(zip(floats[0::step], floats[1::step]))
 
     def _in_radius(self, event: TrafikinfoEvent) -> bool:
         # Include important unlocated messages (often national) to avoid missing safety info.
         if not event.geometry_wgs84:
             return self._is_important_without_geo(event)
 
-        pts = self._wkt_points(event.geometry_wgs84)
+        pts, bbox = self._wkt_geometry(event.geometry_wgs84)
         if not pts:
             return False
 
-        # Compute minimum distance to any point in the geometry.
         center_lon = float(self._longitude)
         center_lat = float(self._latitude)
         radius = max(0.1, float(self._radius_km))
-        for lon, lat in pts[:200]:  # cap work for huge geometries
-            if self._haversine_km(center_lon, center_lat, lon, lat) <= radius:
-                return True
-        return False
+
+        # Bounding-box prefilter: most events lie far outside the radius, so
+        # reject them with four degree-space comparisons before any trig. The
+        # margin converts km to degrees (1 deg lat ~ 111 km; lon shrinks by
+        # cos(lat)).
+        if bbox is not None:
+            dlat_deg = radius / 111.0
+            dlon_deg = radius / (111.0 * max(0.1, _cos(_rad(center_lat))))
+            min_lon, max_lon, min_lat, max_lat = bbox
+            if (
+                min_lon > center_lon + dlon_deg
+                or max_lon < center_lon - dlon_deg
+                or min_lat > center_lat + dlat_deg
+                or max_lat < center_lat - dlat_deg
+            ):
+                return False
+
+        # Batched membership test over the geometry (cap work for huge ones).
+        return _any_point_within_km(
+            center_lon,
+            center_lat,
+            pts[:200],
+            radius,
+        )
 
     async def _async_update_data(self) -> TrafikinfoData:
         if not self._api_key:
             raise TrafikinfoAuthenticationError("Missing API key")
 
         session = aiohttp_client.async_get_clientsession(self.hass)
-        xml_request = _build_request_xml(self._api_key, limit=5000)
+
+        headers = dict(self._post_headers)
+        if self.data is not None:
+            # Conditional request: if the server honors the validators it can
+            # answer 304 and we keep the previous payload without re-parsing.
+            if self._http_last_modified:
+                headers["If-Modified-Since"] = self._http_last_modified
+            if self._http_etag:
+                headers["If-None-Match"] = self._http_etag
 
         try:
             async with async_timeout.timeout(20):
                 async with session.post(
                     TRAFIKVERKET_DATACACHE_URL,
-                    data=xml_request.encode("utf-8"),
-                    headers={
-                        "Content-Type": "text/xml; charset=utf-8",
-                        "User-Agent": get_user_agent(self.hass),
-                    },
+                    data=self._xml_request_bytes,
+                    headers=headers,
                 ) as resp:
-                    text = await resp.text()
+                    if resp.status == 304 and self.data is not None:
+                        _LOGGER.debug("Trafikverket data not modified (HTTP 304)")
+                        return self.data
+                    # Keep the payload as bytes: the XML parsers consume UTF-8
+                    # directly, so decoding the full body to str here would
+                    # only allocate a second (wchar) copy of a payload that
+                    # can run to tens of MB.
+                    raw = await resp.read()
                     if resp.status in (401, 403):
                         raise TrafikinfoAuthenticationError(
                             f"Authentication failed: HTTP {resp.status}"
                         )
                     if resp.status != 200:
+                        snippet = raw[:300].decode("utf-8", "replace")
                         raise TrafikinfoAPIError(
-                            f"Trafikverket API returned HTTP {resp.status}: {text[:300]}"
+                            f"Trafikverket API returned HTTP {resp.status}: {snippet}"
                         )
+                    self._http_last_modified = resp.headers.get("Last-Modified")
+                    self._http_etag = resp.headers.get("ETag")
         except TrafikinfoError as err:
             raise UpdateFailed(str(err)) from err
         except asyncio.TimeoutError:
@@ -1049,12 +1966,37 @@ class TrafikinfoCoordinator(DataUpdateCoordinator[TrafikinfoData]):
                 f"Unexpected error fetching Trafikverket data: {err}"
             ) from err
 
+        # Even without HTTP validator support, an unchanged LASTCHANGEID means
+        # the dataset is identical to the last poll — skip the parse entirely.
+        if self.data is not None and self.data.last_change_id:
+            m = _LASTCHANGEID_RE.search(raw)
+            if m and m.group(1).decode("utf-8", "replace").strip() == self.data.last_change_id:
+                _LOGGER.debug(
+                    "Trafikverket data unchanged (LASTCHANGEID=%s)",
+                    self.data.last_change_id,
+                )
+                return self.data
+
         try:
-            data = _parse_response(text)
+            if len(raw) > _PARSE_EXECUTOR_THRESHOLD:
+                # Large Sweden-wide payloads take long enough to parse that we
+                # don't want to block the event loop; _parse_response is
+                # stateless so it can run in an executor thread (and lxml
+                # releases the GIL while parsing).
+                data = await self.hass.async_add_executor_job(_parse_response, raw)
+            else:
+                data = _parse_response(raw)
         except TrafikinfoError as err:
             raise UpdateFailed(str(err)) from err
         filtered = [e for e in data.events if self._include_event(e)]
         filtered = self._apply_road_filter(filtered)
+        # Warm the distance cache for everything that survived filtering:
+        # sorting and the six sensors' attribute reads all ask for the same
+        # distances, so computing them here keeps that work out of state
+        # rendering. The events are frozen (slots), hence the LRU rather than
+        # a distance attribute on the event.
+        for e in filtered:
+            self.event_distance_km(e)
         # Best-effort local icon caching for picture cards (run in background to not block)
         icon_ids = [e.icon_id for e in filtered if e.icon_id]
         self.hass.async_create_background_task(
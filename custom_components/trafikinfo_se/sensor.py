@@ -5,7 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 import hashlib
+from itertools import islice
 import logging
+from operator import attrgetter
 from typing import Any
 from urllib.parse import quote
 
@@ -37,7 +39,11 @@ from .const import (
     KNOWN_TRAVEL_TIME_ROUTE_STATUSES,
     TRAFIKVERKET_ICONS_BASE_URL,
 )
-from .coordinator import TrafikinfoCoordinator, TrafikinfoData
+from .coordinator import (
+    MESSAGE_TYPE_VALUE_TO_CATEGORY,  # noqa: F401 (re-export for card/templates)
+    TrafikinfoCoordinator,
+    TrafikinfoData,
+)
 from .travel_time_route import TravelTimeRouteCoordinator, TravelTimeRouteSnapshot
 
 _LOGGER = logging.getLogger(__name__)
@@ -56,26 +62,6 @@ MESSAGE_TYPES: list[str] = [
 if MESSAGE_TYPES != DEFAULT_MESSAGE_TYPES:
     MESSAGE_TYPES = list(DEFAULT_MESSAGE_TYPES)
 
-# Map known MessageTypeValue (code values) into our 7 stable categories.
-# Note: MessageType is typically Swedish category text (e.g. "Olycka"),
-# while MessageTypeValue is a more fine-grained English code (e.g. "Accident").
-MESSAGE_TYPE_VALUE_TO_CATEGORY: dict[str, str] = {
-    # Olycka
-    "Accident": "Olycka",
-    # Hinder
-    "GeneralObstruction": "Hinder",
-    # Vägarbete
-    "MaintenanceWorks": "Vägarbete",
-    # Trafikmeddelande (many subtypes)
-    "VehicleObstruction": "Trafikmeddelande",
-    "AnimalPresenceObstruction": "Trafikmeddelande",
-    "RoadsideAssistance": "Trafikmeddelande",
-    "SpeedManagement": "Trafikmeddelande",
-    "ReroutingManagement": "Trafikmeddelande",
-    "EnvironmentalObstruction": "Trafikmeddelande",
-    "RoadOrCarriagewayOrLaneManagement": "Trafikmeddelande",
-}
-
 MESSAGE_TYPE_ICONS: dict[str, str] = {
     "Viktig trafikinformation": "mdi:alert-octagon",
     "Hinder": "mdi:alert-decagram-outline",
@@ -186,19 +172,28 @@ def _svg_badge_data_uri(label: str, *, bg: str) -> str:
     return "data:image/svg+xml;charset=utf-8," + quote(svg, safe="")
 
 
+# Short labels to keep badges readable in small cards
+_CATEGORY_BADGE_LABELS: dict[str, str] = {
+    "Viktig trafikinformation": "!",
+    "Hinder": "H",
+    "Olycka": "O",
+    "Restriktion": "R",
+    "Trafikmeddelande": "T",
+    "Vägarbete": "V",
+}
+
+# The badge SVGs are fixed per category, so build (and quote-encode) them
+# once at import instead of on every attribute render.
+_FALLBACK_PICTURES: dict[str, str] = {
+    cat: _svg_badge_data_uri(label, bg=MESSAGE_TYPE_COLORS.get(cat, "#616161"))
+    for cat, label in _CATEGORY_BADGE_LABELS.items()
+}
+# Generic grey "T" badge for anything outside the known categories.
+_DEFAULT_FALLBACK_PICTURE = _svg_badge_data_uri("T", bg="#616161")
+
+
 def _fallback_picture_for_category(category: str | None) -> str:
-    cat = category or "T"
-    bg = MESSAGE_TYPE_COLORS.get(cat, "#616161")
-    # Use a short label to keep it readable in small cards
-    label_map = {
-        "Viktig trafikinformation": "!",
-        "Hinder": "H",
-        "Olycka": "O",
-        "Restriktion": "R",
-        "Trafikmeddelande": "T",
-        "Vägarbete": "V",
-    }
-    return _svg_badge_data_uri(label_map.get(cat, cat[:1]), bg=bg)
+    return _FALLBACK_PICTURES.get(category or "", _DEFAULT_FALLBACK_PICTURE)
 
 
 def _category_picture_url(
@@ -215,26 +210,23 @@ def _category_picture_url(
     return remote if isinstance(remote, str) and remote else None
 
 
-def _category_for_event(event: Any) -> str | None:
-    """Resolve one of MESSAGE_TYPES for a TrafikinfoEvent-like object."""
-    # Prefer Swedish category text when it matches our known stable categories.
-    msg_type = getattr(event, "message_type", None)
-    if isinstance(msg_type, str) and msg_type in set(MESSAGE_TYPES):
-        return msg_type
-
-    # Map more fine-grained code values to categories.
-    msg_value = getattr(event, "message_type_value", None)
-    if isinstance(msg_value, str):
-        mapped = MESSAGE_TYPE_VALUE_TO_CATEGORY.get(msg_value)
-        if mapped:
-            return mapped
-
-    # If we still don't know: fall back to MessageType if it's set (even if unexpected),
-    # otherwise keep it unclassified.
-    if isinstance(msg_type, str) and msg_type.strip():
-        return msg_type.strip()
-
-    return None
+# Incident signature fields: one C-level tuple extraction per event instead
+# of a chain of getattr calls. The first _SIG_TIMESTAMP_COUNT entries are the
+# datetime fields.
+_SIG_TIMESTAMP_COUNT = 5
+_SIG_ATTRGET = attrgetter(
+    "modified_time",
+    "version_time",
+    "publication_time",
+    "end_time",
+    "start_time",
+    "severity_code",
+    "severity_text",
+    "message_type",
+    "message_type_value",
+    "header",
+    "message",
+)
 
 
 def _minutes_from_seconds(value: float | None) -> float | None:
@@ -287,16 +279,13 @@ async def async_setup_entry(
     )
     if not isinstance(enabled, list) or not enabled:
         enabled = list(DEFAULT_MESSAGE_TYPES)
-    enabled_set = set(enabled)
-
-    entities: list[SensorEntity] = []
-    for msg_type in DEFAULT_MESSAGE_TYPES:
-        if msg_type in enabled_set and msg_type in SENSOR_DESCRIPTIONS:
-            description = SENSOR_DESCRIPTIONS[msg_type]
-            entities.append(
-                TrafikinfoMessageTypeSensor(entry, coordinator, description)
-            )
-    async_add_entities(entities)
+    enabled_set = frozenset(enabled)
+
+    async_add_entities(
+        TrafikinfoMessageTypeSensor(entry, coordinator, SENSOR_DESCRIPTIONS[msg_type])
+        for msg_type in DEFAULT_MESSAGE_TYPES
+        if msg_type in enabled_set and msg_type in SENSOR_DESCRIPTIONS
+    )
 
 
 class TrafikinfoTravelTimeRouteEntity(
@@ -329,18 +318,17 @@ class TrafikinfoTravelTimeRouteEntity(
         self._attr_suggested_object_id = (
             f"{DOMAIN}_route_{slugify(self._route_id)}_{slugify(key)}"
         )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
+        # Device info is immutable per config entry; build it once instead of
+        # allocating a new DeviceInfo on every registry read.
+        self._attr_device_info = DeviceInfo(
             identifiers={
                 (
                     DOMAIN,
-                    f"{self._entry.entry_id}_travel_time_route_{self._route_id}",
+                    f"{entry.entry_id}_travel_time_route_{self._route_id}",
                 )
             },
             entry_type=DeviceEntryType.SERVICE,
-            name=self._entry.title or self._route_name,
+            name=entry.title or self._route_name,
             manufacturer="Trafikverket",
             model="Restid",
         )
@@ -532,26 +520,50 @@ class TrafikinfoMessageTypeSensor(
             f"{entry.entry_id}_message_type_{slugify(self._message_type)}"
         )
         self._attr_icon = entity_description.icon_mdi
+        # Device info is immutable per config entry; build it once instead of
+        # allocating a new DeviceInfo on every registry read.
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            name=entry.title,
+            manufacturer="Trafikverket",
+            model="Trafikhändelser",
+        )
+
+        # Static per-category lookups resolved once instead of on every read.
+        self._icon_id = CATEGORY_ICON_ID.get(self._message_type)
+        # Picture URL cached per coordinator icons_version: it only changes
+        # when the local icon cache gains files.
+        self._picture_url: str | None = None
+        self._picture_url_version: int = -1
+
+        # Rendered attributes memoized per (coordinator data, entry options,
+        # icons version) triple: HA reads attributes far more often than the
+        # data changes.
+        self._attrs_cache: dict[str, Any] | None = None
+        self._attrs_cache_key: tuple[int, int, int] | None = None
 
         self._incident_bus_name: str | None = None
         self._diff_initialized: bool = False
-        # incident_key -> signature (used to detect new/changed incidents)
-        self._last_incident_signatures: dict[str, str] = {}
+        # incident_key -> fingerprint (used to detect new/changed incidents)
+        self._last_incident_signatures: dict[str, int] = {}
         if self._message_type in self._EVENT_PUBLISH_TYPES:
             # Per-incident event (fires once per new/changed incident)
             # - trafikinfo_se_hinder_incident
             # - trafikinfo_se_olycka_incident
             self._incident_bus_name = f"{DOMAIN}_{slugify(self._message_type)}_incident"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            entry_type=DeviceEntryType.SERVICE,
-            name=self._entry.title,
-            manufacturer="Trafikverket",
-            model="Trafikhändelser",
-        )
+    def _category_picture(self) -> str | None:
+        """Return the category picture URL, recomputed only when icons change."""
+        if self._icon_id is None:
+            return None
+        version = self.coordinator.icons_version
+        if version != self._picture_url_version:
+            self._picture_url = _category_picture_url(
+                self.coordinator, self._message_type
+            )
+            self._picture_url_version = version
+        return self._picture_url
 
     def _get_dismissed_events(self) -> dict[str, dict]:
         """Get dismissed events from entry options."""
@@ -584,26 +596,9 @@ class TrafikinfoMessageTypeSensor(
         return stored_signature == current_signature
 
     def _filtered_events(self) -> list[Any]:
-        data: TrafikinfoData | None = self.coordinator.data
-        if not data:
-            return []
-        # Group into stable categories using MessageType when possible, otherwise map
-        # MessageTypeValue (code values) into categories.
-        out = []
-        for e in data.events:
-            if _category_for_event(e) == self._message_type:
-                out.append(e)
-        return out
-
-    def _visible_events(self) -> list[Any]:
-        """Get filtered events excluding dismissed ones."""
-        events = self._filtered_events()
-        return [e for e in events if not self._is_event_dismissed(e)]
-
-    def _dismissed_count(self) -> int:
-        """Count how many filtered events are currently dismissed."""
-        events = self._filtered_events()
-        return sum(1 for e in events if self._is_event_dismissed(e))
+        # The coordinator groups events into stable categories once per
+        # update; all message-type sensors share that single pass.
+        return self.coordinator.events_by_category(self._message_type)
 
     def _incident_key(self, event: Any) -> str | None:
         """Stable key for one incident."""
@@ -620,39 +615,35 @@ class TrafikinfoMessageTypeSensor(
             return hashlib.sha1(f"{head}|{msg}".encode("utf-8")).hexdigest()
         return None
 
+    def _incident_fingerprint(self, event: Any) -> int:
+        """In-process change fingerprint for one incident.
+
+        Hashes the raw attribute tuple instead of building the string
+        signature, skipping ~11 str coercions and a join per event per
+        update. Only valid within this process (hash() is salted): the
+        persisted dismissal flow keeps using _incident_signature.
+        """
+        return hash(_SIG_ATTRGET(event))
+
     def _incident_signature(self, event: Any) -> str:
         """Signature that changes when an incident changes."""
-        # Prefer timestamps that usually change on updates.
-        parts: list[str] = []
-        for attr in (
-            "modified_time",
-            "version_time",
-            "publication_time",
-            "end_time",
-            "start_time",
-        ):
-            v = getattr(event, attr, None)
-            try:
-                parts.append(v.isoformat() if hasattr(v, "isoformat") else str(v))
-            except Exception:
-                parts.append(str(v))
-        # Include key text to catch changes even if timestamps are missing.
-        for attr in (
-            "severity_code",
-            "severity_text",
-            "message_type",
-            "message_type_value",
-            "header",
-            "message",
-        ):
-            v = getattr(event, attr, None)
-            parts.append(str(v) if v is not None else "")
+        vals = _SIG_ATTRGET(event)
+        # Timestamps first (these usually change on updates), then key text
+        # fields that catch changes even if timestamps are missing.
+        parts = [
+            v.isoformat() if hasattr(v, "isoformat") else str(v)
+            for v in vals[:_SIG_TIMESTAMP_COUNT]
+        ]
+        parts.extend(
+            str(v) if v is not None else "" for v in vals[_SIG_TIMESTAMP_COUNT:]
+        )
         return "|".join(parts)
 
     def _incident_dict(self, event: Any) -> dict[str, Any]:
         """Convert one incident to dict including distance_km if available."""
         try:
-            d = event.as_dict() if hasattr(event, "as_dict") else {}
+            # Copy: the coordinator's dict is shared across callers.
+            d = dict(self.coordinator.event_as_dict(event))
         except Exception:
             d = {}
         dist = self.coordinator.event_distance_km(event)
@@ -669,14 +660,14 @@ class TrafikinfoMessageTypeSensor(
             return
 
         filtered = self._filtered_events()
-        cur: dict[str, str] = {}
+        cur: dict[str, int] = {}
         cur_events_by_key: dict[str, Any] = {}
         for e in filtered:
             k = self._incident_key(e)
             if not k:
                 continue
             cur_events_by_key[k] = e
-            cur[k] = self._incident_signature(e)
+            cur[k] = self._incident_fingerprint(e)
 
         if not self._diff_initialized:
             # Avoid startup spam: establish baseline on first publish.
@@ -714,6 +705,8 @@ class TrafikinfoMessageTypeSensor(
         self._last_incident_signatures = cur
 
     def _handle_coordinator_update(self) -> None:
+        self._attrs_cache = None
+        self._attrs_cache_key = None
         # Fire event before writing state so listeners can react immediately to the update.
         self._maybe_fire_event()
         super()._handle_coordinator_update()
@@ -722,7 +715,13 @@ class TrafikinfoMessageTypeSensor(
     def native_value(self) -> int | None:
         if not self.coordinator.data:
             return None
-        return len(self._visible_events())
+        # The coordinator keeps per-category counts alongside the buckets, so
+        # the common case (no dismissals) is a single dict lookup.
+        if not self._get_dismissed_events():
+            return self.coordinator.category_count(self._message_type)
+        return sum(
+            1 for e in self._filtered_events() if not self._is_event_dismissed(e)
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -731,24 +730,38 @@ class TrafikinfoMessageTypeSensor(
         if not data:
             return attrs
 
+        # Attributes only change when the coordinator data or the entry
+        # options (dismissals, filters) are replaced - both of which produce
+        # new objects - or when the local icon cache gains files, so identical
+        # reads can reuse the previous dict.
+        cache_key = (id(data), id(self._entry.options), self.coordinator.icons_version)
+        if cache_key == self._attrs_cache_key and self._attrs_cache is not None:
+            return self._attrs_cache
+
         # Expose a simple icon URL surface for dashboards/templates.
         # Note: we intentionally do not set the HA `entity_picture` property anymore
         # (always use MDI icon), but we keep URLs in attributes for users who want them.
-        picture_url = _category_picture_url(self.coordinator, self._message_type)
+        picture_url = self._category_picture()
         # Always expose the URL in attributes so users can use it in templates/cards.
         entity_picture_attr = picture_url
 
         all_filtered = self._filtered_events()
-        visible = self._visible_events()
-        dismissed_count = self._dismissed_count()
-        sorted_events = self.coordinator.sort_events(visible)
+        # The coordinator caches the sorted order per category; dropping
+        # dismissed events afterwards preserves that order, so the sort runs
+        # once per update instead of once per attribute read.
+        sorted_all = self.coordinator.sorted_events_by_category(self._message_type)
+        sorted_events = [e for e in sorted_all if not self._is_event_dismissed(e)]
+        visible = sorted_events
+        dismissed_count = len(all_filtered) - len(visible)
         max_items = max(0, int(self.coordinator.max_items))
         if max_items == 0:
             events = []
         else:
             out = []
-            for e in sorted_events[:max_items]:
-                d = e.as_dict()
+            # islice walks the window in place instead of copying it out.
+            for e in islice(sorted_events, max_items):
+                # Copy before adding keys: the coordinator's dict is shared.
+                d = dict(self.coordinator.event_as_dict(e))
                 icon_id = d.get("icon_id")
                 local_icon = self.coordinator.get_local_icon_url(icon_id)
                 if local_icon:
@@ -771,29 +784,25 @@ class TrafikinfoMessageTypeSensor(
                 out.append(d)
             events = out
 
+        # All of these are plain properties the coordinator defines
+        # unconditionally, so direct access beats getattr-with-default.
+        coordinator = self.coordinator
         attrs.update(
             {
                 "entry_id": self._entry.entry_id,
                 "message_type": self._message_type,
-                "filter_mode": getattr(self.coordinator, "filter_mode", None),
-                "filter_counties": getattr(self.coordinator, "counties", None),
-                "filter_roads": getattr(self.coordinator, "filter_roads", None),
-                "filter_road_safety_bypass": getattr(
-                    self.coordinator, "road_filter_safety_bypass", None
-                ),
-                "filter_center": {
-                    "latitude": getattr(self.coordinator, "latitude", None),
-                    "longitude": getattr(self.coordinator, "longitude", None),
-                }
-                if getattr(self.coordinator, "filter_mode", None) == "coordinate"
-                else None,
-                "filter_radius_km": getattr(self.coordinator, "radius_km", None)
-                if getattr(self.coordinator, "filter_mode", None) == "coordinate"
+                "filter_mode": coordinator.filter_mode,
+                "filter_counties": coordinator.counties,
+                "filter_roads": coordinator.filter_roads,
+                "filter_road_safety_bypass": coordinator.road_filter_safety_bypass,
+                "filter_center": coordinator.filter_center_attr(),
+                "filter_radius_km": coordinator.radius_km
+                if coordinator.filter_mode == "coordinate"
                 else None,
-                "sort_mode": getattr(self.coordinator, "sort_mode", None),
+                "sort_mode": coordinator.sort_mode,
                 "sort_reference": {
-                    "latitude": getattr(self.coordinator, "sort_latitude", None),
-                    "longitude": getattr(self.coordinator, "sort_longitude", None),
+                    "latitude": coordinator.sort_latitude,
+                    "longitude": coordinator.sort_longitude,
                 },
                 "entity_picture": entity_picture_attr,
                 "icon_url": picture_url,
@@ -809,4 +818,6 @@ class TrafikinfoMessageTypeSensor(
                 "sse_url": data.sse_url,
             }
         )
+        self._attrs_cache = attrs
+        self._attrs_cache_key = cache_key
         return attrs